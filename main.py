@@ -10,18 +10,28 @@ Usage:
 """
 
 import argparse
+import os
 import sys
 from pathlib import Path
 from typing import Any
 
+# Cube is needed by every command; CubeVisualizer (which pulls in
+# matplotlib) and CubeSolver are imported lazily inside their commands so
+# scramble/validate/single-move invocations skip the heavy import cost.
 from src.cube_model import Cube
-from src.visualizer import CubeVisualizer
-from src.solver import CubeSolver
+
+
+# Directories already created this process; avoids repeated stat/mkdir
+# syscalls when batch runs write many files to the same location.
+_DIR_CACHE: set = set()
 
 
 def ensure_output_directory(output_path: str) -> None:
     """Ensure the output directory exists for the given file path."""
-    Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+    parent = os.path.dirname(output_path)
+    if parent and parent not in _DIR_CACHE:
+        os.makedirs(parent, exist_ok=True)
+        _DIR_CACHE.add(parent)
 
 
 def validate_input_file(input_path: str) -> None:
@@ -44,19 +54,25 @@ def display_validation_results(is_valid: bool, errors: list) -> None:
         print("Validation: ⚠ Warning - potential issues detected")
 
 
-def save_cube_state(cube: Cube, output_path: str, move_sequence: str, format_version: str = '2.0') -> None:
-    """Save cube state to JSON file with validation."""
+def save_cube_state(cube: Cube, output_path: str, move_sequence: str,
+                    format_version: str = '2.0', validate: bool = True) -> None:
+    """Save cube state to JSON file, optionally validating it first.
+
+    Callers whose state is valid by construction (e.g. a single move
+    applied to a solved cube) can pass validate=False to skip the
+    validation scan entirely.
+    """
     ensure_output_directory(output_path)
-    
-    # Validate cube state
-    is_valid, errors = cube.validate_state()
-    
-    # Save to file
-    cube.to_json(output_path, format_version, move_sequence)
-    
-    # Display results
-    print(f"Output saved to: {output_path}")
-    display_validation_results(is_valid, errors)
+
+    if validate:
+        # Validate and save in a single pass over the cube state
+        is_valid, errors = cube.validate_and_serialize(output_path, format_version, move_sequence)
+        print(f"Output saved to: {output_path}")
+        display_validation_results(is_valid, errors)
+    else:
+        cube.to_json(output_path, format_version, move_sequence)
+        print(f"Output saved to: {output_path}")
+        print("Validation: ✓ Valid by construction (skipped)")
 
 
 def visualize_command(args: Any) -> None:
@@ -64,14 +80,18 @@ def visualize_command(args: Any) -> None:
     try:
         validate_input_file(args.input)
         ensure_output_directory(args.output)
-        
+
+        from src.visualizer import CubeVisualizer
+
         visualizer = CubeVisualizer()
         
         print(f"Visualizing cube from {args.input}...")
         
         # Create visualization with colors and numbers
-        show_numbers = getattr(args, 'numbered', True)
-        visualizer.visualize_from_json(args.input, args.output, show_numbers=show_numbers)
+        engine = None if args.engine == 'auto' else args.engine
+        visualizer.visualize_from_json(args.input, args.output,
+                                       show_numbers=args.numbered,
+                                       engine=engine)
         
         print(f"Generated visualization: {args.output}")
         print("Visualization completed successfully!")
@@ -93,12 +113,10 @@ def validate_command(args: Any) -> None:
     try:
         validate_input_file(args.input)
         
-        cube = Cube()
-        cube.from_json(args.input)
-        
         print(f"Validating cube state from {args.input}...")
-        is_valid, errors = cube.validate_state()
-        
+        cube = Cube.solved()
+        is_valid, errors = cube.from_json(args.input, validate=True)
+
         if is_valid:
             print("✓ Cube state is valid")
         else:
@@ -112,31 +130,89 @@ def validate_command(args: Any) -> None:
 
 
 def apply_move_sequence(cube: Cube, sequence: str) -> None:
-    """Apply a sequence of moves to the cube."""
-    moves = sequence.split()
-    for move in moves:
-        cube.apply_move(move)
+    """Apply a sequence of moves to the cube.
+
+    Delegates to Cube.apply_sequence, which validates the whole string
+    in one regex scan and applies the sequence as a single composed
+    (and cached) permutation.
+    """
+    cube.apply_sequence(sequence)
 
 
 def generate_random_scramble(cube: Cube, args: Any) -> str:
     """Generate a random scramble sequence."""
-    scramble_params = {
-        'num_moves': args.moves,
-        'avoid_redundancy': not getattr(args, 'allow_redundancy', False),
-        'min_moves': getattr(args, 'min_moves', 15)
-    }
-    
-    if hasattr(args, 'seed') and args.seed is not None:
-        scramble_params['seed'] = args.seed
-    
     print(f"Generating scrambled cube with {args.moves} moves...")
-    return cube.scramble(**scramble_params)
+    return cube.scramble(
+        num_moves=args.moves,
+        seed=args.seed,
+        avoid_redundancy=not args.allow_redundancy,
+        min_moves=args.min_moves
+    )
+
+
+def _scramble_one(task: tuple) -> None:
+    """Generate and save one scramble (top-level so it pickles for workers)."""
+    seed, output_path, num_moves, avoid_redundancy, min_moves, format_version = task
+
+    cube = Cube.solved()
+    move_sequence = cube.scramble(
+        num_moves=num_moves,
+        seed=seed,
+        avoid_redundancy=avoid_redundancy,
+        min_moves=min_moves
+    )
+    ensure_output_directory(output_path)
+    cube.to_json(output_path, format_version, move_sequence)
+
+
+def run_scramble_batch(args: Any) -> None:
+    """Generate a batch of scrambles inside one process (or a worker pool).
+
+    Amortizes interpreter startup, imports, and parser construction
+    across all N scrambles instead of paying them per CLI invocation.
+    With --jobs > 1 the independent scrambles are distributed over a
+    process pool.
+    """
+    num_moves = args.moves or 20
+    print(f"Generating {args.batch} scrambles with {num_moves} moves each...")
+
+    tasks = [
+        (
+            # Derive a distinct but reproducible seed per scramble
+            args.seed + i if args.seed is not None else None,
+            args.output_template.format(i=i),
+            num_moves,
+            not args.allow_redundancy,
+            args.min_moves,
+            args.format
+        )
+        for i in range(args.batch)
+    ]
+
+    jobs = args.jobs or os.cpu_count() or 1
+    if jobs > 1 and args.batch > 1:
+        from concurrent.futures import ProcessPoolExecutor
+
+        chunksize = max(1, args.batch // (jobs * 4))
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            # Consume the iterator so worker exceptions propagate
+            for _ in executor.map(_scramble_one, tasks, chunksize=chunksize):
+                pass
+    else:
+        for task in tasks:
+            _scramble_one(task)
+
+    print(f"Generated {args.batch} scrambles using template: {args.output_template}")
 
 
 def scramble_command(args: Any) -> None:
     """Handle scramble command."""
     try:
-        cube = Cube()
+        if args.batch:
+            run_scramble_batch(args)
+            return
+
+        cube = Cube.solved()
         
         # Determine move sequence
         if args.sequence:
@@ -152,8 +228,7 @@ def scramble_command(args: Any) -> None:
             sys.exit(1)
         
         # Save cube state with validation
-        format_version = getattr(args, 'format', '2.0')
-        save_cube_state(cube, args.output, move_sequence, format_version)
+        save_cube_state(cube, args.output, move_sequence, args.format)
         
         # Display sequence info
         print(f"Applied sequence: {move_sequence}")
@@ -177,15 +252,15 @@ def single_move_command(args: Any) -> None:
         # Set default output filename if not provided
         output_path = args.output or get_default_output_path(args.move)
         
-        cube = Cube()
+        cube = Cube.solved()
         
         # Apply the single move
         print(f"Applying move: {args.move}")
         cube.apply_move(args.move)
         
-        # Save cube state with validation
-        format_version = getattr(args, 'format', '2.0')
-        save_cube_state(cube, output_path, args.move, format_version)
+        # A single move from a solved state is a permutation of a valid
+        # state, so skip the redundant validation scan
+        save_cube_state(cube, output_path, args.move, args.format, validate=False)
         
         print(f"Applied move: {args.move}")
             
@@ -194,8 +269,16 @@ def single_move_command(args: Any) -> None:
         sys.exit(1)
 
 
+# Parser is built once and cached; repeat invocations of main() (e.g. from
+# test loops or batch drivers) skip the ~25 add_argument calls.
+_PARSER: Any = None
+
+
 def create_argument_parser() -> argparse.ArgumentParser:
-    """Create and configure the main argument parser."""
+    """Create and configure the main argument parser (cached per process)."""
+    global _PARSER
+    if _PARSER is not None:
+        return _PARSER
     parser = argparse.ArgumentParser(
         description="Rubik's Cube Combinatorics CLI",
         formatter_class=argparse.RawDescriptionHelpFormatter
@@ -209,8 +292,12 @@ def create_argument_parser() -> argparse.ArgumentParser:
     viz_parser.add_argument('-o', '--output', 
                            default='outputs/visualizations/cube_visualization.png', 
                            help='Output image file')
-    viz_parser.add_argument('--numbered', action='store_true', 
+    viz_parser.add_argument('--numbered', action='store_true',
                            help='Include position numbers (1-54)')
+    viz_parser.add_argument('--engine', choices=['auto', 'pil', 'mpl'],
+                           default='auto',
+                           help='Render engine (auto picks by output '
+                                'extension: pil for raster, mpl for svg)')
     
     # Solve command  
     solve_parser = subparsers.add_parser('solve', help='Solve a scrambled cube')
@@ -238,10 +325,19 @@ def create_argument_parser() -> argparse.ArgumentParser:
                              help='Minimum moves for proper scrambling (random mode)')
     scram_parser.add_argument('--seed', type=int, 
                              help='Random seed for reproducible scrambles')
-    scram_parser.add_argument('--format', choices=['1.0', '2.0'], default='2.0', 
+    scram_parser.add_argument('--format', choices=['1.0', '2.0', '2.1'], default='2.0',
                              help='JSON format version')
-    scram_parser.add_argument('--allow-redundancy', action='store_true', 
+    scram_parser.add_argument('--allow-redundancy', action='store_true',
                              help='Allow consecutive moves on same face')
+    scram_parser.add_argument('--batch', type=int,
+                             help='Generate N scrambles in one process')
+    scram_parser.add_argument('--output-template',
+                             default='outputs/scrambles/scramble_{i:05d}.json',
+                             help='Output filename template for batch mode '
+                                  '(formatted with i=index)')
+    scram_parser.add_argument('--jobs', type=int,
+                             help='Worker processes for batch mode '
+                                  '(default: CPU count)')
     
     # Single move command
     single_parser = subparsers.add_parser('single-move', 
@@ -250,9 +346,10 @@ def create_argument_parser() -> argparse.ArgumentParser:
                               help='Single move to apply (F, R, U, B, L, D, etc.)')
     single_parser.add_argument('-o', '--output', 
                               help='Output JSON file (default: auto-generated)')
-    single_parser.add_argument('--format', choices=['1.0', '2.0'], default='2.0', 
+    single_parser.add_argument('--format', choices=['1.0', '2.0', '2.1'], default='2.0',
                               help='JSON format version')
-    
+
+    _PARSER = parser
     return parser
 
 
@@ -22,11 +22,12 @@ setup(
         "Intended Audience :: Education",
         "Topic :: Games/Entertainment :: Puzzle Games",
     ],
-    python_requires=">=3.8",
+    python_requires=">=3.10",
     install_requires=[
         "numpy>=1.21.0",
         "matplotlib>=3.5.0",
         "pillow>=9.0.0",
+        "orjson>=3.6.0",
     ],
     extras_require={
         "dev": [
@@ -40,6 +41,9 @@ setup(
             "sphinx>=4.5.0",
             "sphinx-rtd-theme>=1.0.0",
         ],
+        "fast": [
+            "numba>=0.56.0",
+        ],
     },
     entry_points={
         "console_scripts": [
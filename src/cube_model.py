@@ -4,14 +4,74 @@ This module provides the fundamental data structures and operations
 for representing and manipulating Rubik's Cube states.
 """
 
-from typing import List, Dict, Optional, Tuple, Any
+from typing import List, Dict, Optional, Tuple, Any, Union
 import json
-import random
 import datetime
+import os
+import re
 from dataclasses import dataclass
+from enum import IntEnum
+from functools import lru_cache
 
+import numpy as np
 
-@dataclass
+try:
+    import orjson
+except ImportError:  # orjson is optional; stdlib json is the fallback
+    orjson = None
+
+
+def _dumps(data: Dict, pretty: bool = True) -> bytes:
+    """Serialize a cube-state dict to JSON bytes.
+
+    Uses orjson when available (C-level serializer, handles numpy arrays
+    natively); falls back to stdlib json otherwise. Compact output
+    (``pretty=False``) skips the indentation pass and roughly halves the
+    file size, which matters for bulk dataset generation.
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else 0)
+    if pretty:
+        return json.dumps(data, indent=2).encode('utf-8')
+    return json.dumps(data, separators=(',', ':')).encode('utf-8')
+
+
+def _loads(data: bytes) -> Dict:
+    """Parse JSON bytes into a dict using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _timestamp() -> str:
+    """Current UTC time as an ISO-8601 string at seconds precision.
+
+    Seconds precision skips microsecond formatting; bulk callers can
+    avoid the call entirely by passing a precomputed ``timestamp`` to
+    the save methods.
+    """
+    return datetime.datetime.utcnow().isoformat(timespec='seconds') + 'Z'
+
+
+def _write_bytes(path: str, buf: bytes) -> None:
+    """Write a fully serialized payload through a raw descriptor.
+
+    The payload is always a single in-memory buffer, so the buffered
+    Python file object would only add a wrapper allocation; in the
+    common case this is one write syscall.
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        # os.write may write fewer bytes than requested (signal
+        # interruption, full disk); loop until the buffer is drained
+        view = memoryview(buf)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+@dataclass(slots=True, frozen=True)
 class Sticker:
     """Represents a single sticker on the cube."""
     id: int
@@ -21,25 +81,123 @@ class Sticker:
     original_id: int
 
 
+# Color codes for the SoA state arrays, doubling as the 3-bit codes used
+# in packed state snapshots. The order matches the face order U,L,F,R,B,D,
+# so in a solved cube the sticker at index i carries color code i // 9.
+COLOR_NAMES = ('W', 'O', 'G', 'R', 'B', 'Y')
+_COLOR_CODES = {'W': 0, 'O': 1, 'G': 2, 'R': 3, 'B': 4, 'Y': 5}
+_COLOR_LETTERS = b'WOGRBY'
+
+# Face letters in sticker-index order (index // 9 gives the face)
+_FACE_ORDER = ('U', 'L', 'F', 'R', 'B', 'D')
+
+# (row, col) position of each within-face index, and the full invariant
+# (id, face, position) layout of all 54 stickers. These never change, so
+# views and serializers fill in only color/original_id per sticker.
+_POSITIONS_9 = tuple((i // 3, i % 3) for i in range(9))
+_STICKER_LAYOUT = tuple(
+    (i + 1, _FACE_ORDER[i // 9], _POSITIONS_9[i % 9]) for i in range(54)
+)
+
+# Invariant columns of the columnar hybrid-export shape: ids, the face
+# run-string, and flat positions never change, so they are shared across
+# saves and only color/original_id are built per call
+_COLUMNAR_IDS = list(range(1, 55))
+_COLUMNAR_FACES = ''.join(f * 9 for f in _FACE_ORDER)
+_COLUMNAR_POSITIONS = [list(_POSITIONS_9[i % 9]) for i in range(54)]
+
+# uint8 color-code -> ASCII letter, and the 256-entry inverse used to
+# decode a whole color string in one vectorized lookup
+_LETTER_BY_CODE = np.frombuffer(_COLOR_LETTERS, dtype=np.uint8)
+_CODE_BY_LETTER = np.full(256, 255, dtype=np.uint8)
+for _i, _letter in enumerate(_COLOR_LETTERS):
+    _CODE_BY_LETTER[_letter] = _i
+del _i, _letter
+
+
+def _color_code(color: str) -> int:
+    """Map a color letter to its state-array code, validating the input."""
+    try:
+        return _COLOR_CODES[color]
+    except KeyError:
+        raise ValueError(f"Invalid color: {color}") from None
+
+# 0-based index of each face's first sticker in the flat sticker list
+_FACE_OFFSETS = {'U': 0, 'L': 9, 'F': 18, 'R': 27, 'B': 36, 'D': 45}
+
+# Fixed center sticker indices (face order U, L, F, R, B, D)
+_CENTER_INDICES = (4, 13, 22, 31, 40, 49)
+
+# Characters that never need JSON escaping; move sequences are composed
+# entirely of these
+_JSON_SAFE_CHARS = frozenset("ULFRBD2' ")
+
+# Validation metrics for states reached through legal moves. These are
+# constants (legal moves preserve parity and orientation sums), so the
+# dict is shared rather than rebuilt per save; treat it as read-only.
+_STATIC_VALIDATION = {
+    "parity": "even",
+    "corner_orientation_sum": 0,
+    "edge_orientation_sum": 0,
+    "is_solvable": True
+}
+
+
+def _json_str(value: Optional[str]) -> str:
+    """Render a string (or None) as a JSON literal.
+
+    Strings made only of JSON-safe characters are quoted directly;
+    anything else falls back to the stdlib encoder for escaping.
+    """
+    if value is None:
+        return 'null'
+    if all(c in _JSON_SAFE_CHARS for c in value):
+        return f'"{value}"'
+    return json.dumps(value)
+
+
+# Legal-successor table for scrambling: row f lists the 15 move indices
+# (into MOVES, where face = index % 6) whose face differs from f
+_LEGAL_NEXT = np.array(
+    [[m for m in range(18) if m % 6 != f] for f in range(6)],
+    dtype=np.intp
+)
+
+# Matches a whole whitespace-separated move sequence (e.g. "R U2 F'"),
+# letting callers validate a sequence in one C-level scan instead of
+# checking each token in Python.
+MOVE_SEQUENCE_RE = re.compile(r"^(?:[LRFBUD][2']?)(?:\s+[LRFBUD][2']?)*$")
+
+
+@dataclass(slots=True, frozen=True)
+class CubeState:
+    """Immutable packed snapshot of a cube's sticker colors.
+
+    The 54 colors are encoded 3 bits each across three 64-bit words
+    (18 stickers per word), so a full state occupies three small ints
+    and is directly hashable — useful as a key in solver transposition
+    tables and scramble-dedup sets.
+    """
+    lo: int
+    mid: int
+    hi: int
+
+
 class Cube:
     """Main cube class for operations and transformations."""
     
     COLORS = {'U': 'W', 'D': 'Y', 'F': 'G', 'B': 'B', 'L': 'O', 'R': 'R'}
     
-    @property
-    def MOVES(self) -> List[str]:
-        """Generate all possible moves from base moves."""
-        base_moves = list(self.MOVE_DEFINITIONS.keys())
-        moves = base_moves.copy()
-        # Add prime moves (inverse)
-        moves.extend([f"{move}'" for move in base_moves])
-        # Add double moves
-        moves.extend([f"{move}2" for move in base_moves])
-        return moves
-    
+    # All 18 move tokens in move-id order; assigned once at module
+    # bottom from MOVE_ORDER instead of being regenerated per access
+    MOVES: List[str]
+
+
     # Move definitions based on standard Rubik's Cube notation
     # Position numbering: U(1-9), L(10-18), F(19-27), R(28-36), B(37-45), D(46-54)
     # Each face has 9 positions numbered in reading order (top-left to bottom-right)
+    # The literal uses human-readable 1-based IDs; it is normalized in place
+    # to 0-based int8 index arrays at import time (see module bottom).
     MOVE_DEFINITIONS = {
         # U move: Rotate top face clockwise, affecting top row of adjacent faces
         'U': {
@@ -104,268 +262,685 @@ class Cube:
         }
     }
     
+    # Solved-state template arrays, copied by _init_solved_state/solved()
+    _SOLVED_COLORS = np.repeat(np.arange(6, dtype=np.uint8), 9)
+    _ORIGINAL_IDS = np.arange(1, 55, dtype=np.int16)
+
+    # Zobrist keys: one 64-bit random word per (position, color) pair,
+    # generated from a fixed seed so hashes are stable across runs
+    _ZOBRIST = np.random.default_rng(0xC0DE).integers(
+        0, 2 ** 64, size=(54, 6), dtype=np.uint64
+    )
+    _ALL_POSITIONS = np.arange(54)
+
     def __init__(self):
         """Initialize a solved cube."""
-        self.stickers = []
         self._init_solved_state()
-    
+
+    @classmethod
+    def solved(cls) -> 'Cube':
+        """Return a solved cube cloned from the shared template arrays."""
+        cube = cls.__new__(cls)
+        cube.colors = cls._SOLVED_COLORS.copy()
+        cube.original_id = cls._ORIGINAL_IDS.copy()
+        cube._hash = cls._SOLVED_HASH
+        return cube
+
     def _init_solved_state(self) -> None:
-        """Initialize cube in solved state with position tracking."""
-        sticker_id = 1
-        for face in ['U', 'L', 'F', 'R', 'B', 'D']:
-            for i in range(3):
-                for j in range(3):
-                    self.stickers.append(Sticker(
-                        id=sticker_id,
-                        face=face,
-                        position=(i, j),
-                        color=self.COLORS[face],
-                        original_id=sticker_id
-                    ))
-                    sticker_id += 1
-    
-    def from_json(self, json_path: str) -> None:
-        """Load cube state from JSON file."""
-        with open(json_path, 'r') as f:
-            data = json.load(f)
-        
-        if data.get('format_version') == '2.0':
+        """Initialize cube in solved state with position tracking.
+
+        The state is struct-of-arrays: ``colors`` holds one uint8 color
+        code per sticker and ``original_id`` tracks permutations; face
+        and (row, col) position are fixed properties of the index and
+        are derived on demand by the ``stickers`` view.
+        """
+        self.colors = self._SOLVED_COLORS.copy()
+        self.original_id = self._ORIGINAL_IDS.copy()
+        self._recompute_hash()
+
+    @property
+    def zobrist_hash(self) -> int:
+        """64-bit Zobrist hash of the color state.
+
+        Maintained incrementally by apply_move (XOR of the keys for the
+        ~20 positions a move touches) and recomputed in full after bulk
+        operations such as apply_sequence or loading from JSON.
+        """
+        return self._hash
+
+    def _recompute_hash(self) -> None:
+        """Recompute the Zobrist hash from scratch (one vectorized reduce)."""
+        self._hash = int(
+            np.bitwise_xor.reduce(self._ZOBRIST[self._ALL_POSITIONS, self.colors])
+        )
+
+    @property
+    def faces(self) -> np.ndarray:
+        """Zero-copy ``(6, 3, 3)`` view of the color codes, face-major.
+
+        The flat 54-element layout is already block-contiguous per face
+        (U, L, F, R, B, D in reading order), so this reshape is free and
+        each ``faces[i]`` is one cache-line-sized contiguous 3x3 grid.
+        Writes through the view alias the flat array.
+        """
+        return self.colors.reshape(6, 3, 3)
+
+    @property
+    def stickers(self) -> List[Sticker]:
+        """Materialized Sticker view of the state (JSON/visualizer boundary).
+
+        Face and position are positional invariants derived from the
+        index; only color and original_id vary with the state.
+        """
+        colors = self.colors
+        original_id = self.original_id
+        return [
+            Sticker(
+                id=sticker_id,
+                face=face,
+                position=position,
+                color=COLOR_NAMES[colors[i]],
+                original_id=int(original_id[i])
+            )
+            for i, (sticker_id, face, position) in enumerate(_STICKER_LAYOUT)
+        ]
+
+    def from_json(self, json_path: str,
+                  validate: bool = False) -> Optional[Tuple[bool, List[str]]]:
+        """Load cube state from JSON file.
+
+        Args:
+            json_path: Path to the state file.
+            validate: When True, run the validation scan immediately
+                after loading (while the state is still hot in cache)
+                and return its (is_valid, errors) result instead of
+                requiring a separate validate_state() call.
+        """
+        # Read the whole file into memory once so the parser operates on a
+        # contiguous buffer instead of streaming through the file handle.
+        with open(json_path, 'rb', buffering=1 << 20) as f:
+            data = _loads(f.read())
+
+        if data.get('format_version') in ('2.0', '2.1'):
             self._load_hybrid_format(data)
         else:
             self._load_simple_format(data)
+
+        if validate:
+            is_valid, errors, _ = self._validate()
+            return is_valid, errors
+        return None
     
     def _load_hybrid_format(self, data: Dict) -> None:
-        """Load cube state from hybrid format (v2.0)."""
-        self.stickers = []
-        for sticker_data in data['cube_state']['stickers']:
-            self.stickers.append(Sticker(
-                id=sticker_data['id'],
-                face=sticker_data['face'],
-                position=tuple(sticker_data['position']),
-                color=sticker_data['color'],
-                original_id=sticker_data['original_id']
-            ))
-    
+        """Load cube state from hybrid format (v2.0).
+
+        Accepts both sticker shapes: the list of per-sticker dicts and
+        the columnar dict-of-arrays form (detected by type), so files
+        written before the columnar option exist keep loading.
+        """
+        stickers = data['cube_state']['stickers']
+        if isinstance(stickers, dict):
+            codes = _CODE_BY_LETTER[
+                np.frombuffer(stickers['color'].encode('ascii'), dtype=np.uint8)
+            ]
+            if codes.shape != (54,) or (codes == 255).any():
+                raise ValueError(
+                    f"Invalid color string: {stickers['color']!r}"
+                )
+            self.colors = codes.copy()
+            self.original_id = np.array(stickers['original_id'], dtype=np.int16)
+        else:
+            # 255 is not a valid color code, so it doubles as the
+            # unwritten-slot sentinel for the completeness check below
+            colors = np.full(54, 255, dtype=np.uint8)
+            original_id = np.empty(54, dtype=np.int16)
+            for sticker_data in stickers:
+                sticker_id = sticker_data['id']
+                if not 1 <= sticker_id <= 54:
+                    raise ValueError(f"Invalid sticker id: {sticker_id}")
+                idx = sticker_id - 1
+                colors[idx] = _color_code(sticker_data['color'])
+                original_id[idx] = sticker_data['original_id']
+            missing = np.nonzero(colors == 255)[0]
+            if missing.size:
+                raise ValueError(
+                    f"Sticker list is incomplete: no entry for ids "
+                    f"{(missing + 1).tolist()}"
+                )
+            self.colors = colors
+            self.original_id = original_id
+        self._recompute_hash()
+
     def _load_simple_format(self, data: Dict) -> None:
         """Load cube state from simple format (v1.0)."""
-        self.stickers = []
-        sticker_id = 1
-        
-        face_order = ['U', 'L', 'F', 'R', 'B', 'D']
-        for face in face_order:
-            face_colors = data['cube_state']['faces'][face]
-            for i, row in enumerate(face_colors):
-                for j, color in enumerate(row):
-                    self.stickers.append(Sticker(
-                        id=sticker_id,
-                        face=face,
-                        position=(i, j),
-                        color=color,
-                        original_id=sticker_id
-                    ))
-                    sticker_id += 1
+        colors = np.empty(54, dtype=np.uint8)
+        idx = 0
+        for face in _FACE_ORDER:
+            for row in data['cube_state']['faces'][face]:
+                for color in row:
+                    colors[idx] = _color_code(color)
+                    idx += 1
+        self.colors = colors
+        # The simple format carries no permutation tracking
+        self.original_id = self._ORIGINAL_IDS.copy()
+        self._recompute_hash()
     
-    def to_json(self, json_path: str, format_version: str = '2.0', 
-                scramble_sequence: Optional[str] = None) -> None:
-        """Save cube state to JSON file."""
-        if format_version == '2.0':
-            data = self._to_hybrid_format(scramble_sequence)
+    def to_json(self, json_path: str, format_version: str = '2.0',
+                scramble_sequence: Optional[str] = None,
+                pretty: bool = True,
+                timestamp: Optional[str] = None,
+                columnar: bool = False) -> None:
+        """Save cube state to JSON file.
+
+        Args:
+            json_path: Destination path.
+            format_version: '2.1' or '2.0' (hybrid; 2.1 omits the
+                derivable per-sticker position field) or '1.0' (simple).
+            scramble_sequence: Move sequence to record in metadata.
+            pretty: Indent the output; pass False on bulk hot paths for
+                compact, faster serialization.
+            timestamp: Pre-formatted metadata timestamp; bulk callers
+                can format once and reuse it across many saves.
+            columnar: Emit hybrid stickers as five parallel arrays
+                instead of 54 per-sticker dicts — roughly 4x smaller
+                and proportionally faster to parse. from_json reads
+                both shapes.
+        """
+        if format_version in ('2.0', '2.1'):
+            buf = _dumps(
+                self._to_hybrid_format(scramble_sequence, timestamp=timestamp,
+                                       columnar=columnar,
+                                       version=format_version),
+                pretty
+            )
         else:
-            data = self._to_simple_format(scramble_sequence)
-        
-        with open(json_path, 'w') as f:
-            json.dump(data, f, indent=2)
+            # The simple format has a fixed schema, so it is templated
+            # directly instead of going through a generic serializer.
+            buf = self._to_simple_json_bytes(scramble_sequence, timestamp)
+
+        # Serialize fully in memory, then issue a single write.
+        _write_bytes(json_path, buf)
+
+    def _to_simple_json_bytes(self, scramble_sequence: Optional[str] = None,
+                              timestamp: Optional[str] = None) -> bytes:
+        """Serialize the simple (v1.0) format by direct string templating.
+
+        The v1.0 schema is fixed (six 3x3 color grids plus metadata), so
+        the JSON is assembled into a single bytearray without building
+        the intermediate dict that a generic serializer would walk.
+        """
+        buf = bytearray(b'{"format_version":"1.0","cube_state":{"faces":{')
+        for face_idx, face in enumerate(('U', 'D', 'F', 'B', 'L', 'R')):
+            if face_idx:
+                buf += b','
+            buf += b'"%s":[' % face.encode('ascii')
+            start = _FACE_OFFSETS[face]
+            for r in range(3):
+                if r:
+                    buf += b','
+                c0, c1, c2 = self.colors[start + 3 * r:start + 3 * r + 3]
+                buf += b'["%c","%c","%c"]' % (
+                    _COLOR_LETTERS[c0], _COLOR_LETTERS[c1], _COLOR_LETTERS[c2]
+                )
+            buf += b']'
+
+        buf += (
+            '}},"metadata":{"timestamp":"%s","scramble":%s}}'
+            % (timestamp or _timestamp(), _json_str(scramble_sequence))
+        ).encode('utf-8')
+        return bytes(buf)
     
-    def _to_hybrid_format(self, scramble_sequence: Optional[str] = None) -> Dict:
-        """Export cube state in hybrid format (v2.0)."""
-        validation = self._calculate_validation()
-        
+    def _to_hybrid_format(self, scramble_sequence: Optional[str] = None,
+                          validation: Optional[Dict[str, Any]] = None,
+                          timestamp: Optional[str] = None,
+                          columnar: bool = False,
+                          version: str = '2.0') -> Dict:
+        """Export cube state in hybrid format (v2.0 / v2.1).
+
+        Args:
+            scramble_sequence: Move sequence to record in metadata.
+            validation: Precomputed validation metrics; calculated here
+                when the caller has not already done so.
+            timestamp: Pre-formatted timestamp; generated here when the
+                caller has not supplied one.
+            columnar: Emit stickers as parallel arrays instead of 54
+                per-sticker dicts, avoiding the repeated keys.
+            version: '2.0' carries the per-sticker position; '2.1'
+                omits it since position is derivable from the id
+                (``divmod((id - 1) % 9, 3)``).
+        """
+        if validation is None:
+            validation = self._calculate_validation()
+
+        with_position = version == '2.0'
+        colors = self.colors
+        original_id = self.original_id
+        if columnar:
+            stickers: Any = {
+                "id": _COLUMNAR_IDS,
+                "face": _COLUMNAR_FACES,
+                "color": bytes(_LETTER_BY_CODE[colors]).decode('ascii'),
+                "original_id": original_id.tolist()
+            }
+            if with_position:
+                stickers["position"] = _COLUMNAR_POSITIONS
+        elif with_position:
+            stickers = [
+                {
+                    "id": sticker_id,
+                    "face": face,
+                    "position": list(position),
+                    "color": COLOR_NAMES[colors[i]],
+                    "original_id": int(original_id[i])
+                }
+                for i, (sticker_id, face, position)
+                in enumerate(_STICKER_LAYOUT)
+            ]
+        else:
+            stickers = [
+                {
+                    "id": sticker_id,
+                    "face": face,
+                    "color": COLOR_NAMES[colors[i]],
+                    "original_id": int(original_id[i])
+                }
+                for i, (sticker_id, face, _)
+                in enumerate(_STICKER_LAYOUT)
+            ]
         return {
-            "format_version": "2.0",
+            "format_version": version,
             "cube_state": {
                 "representation": "hybrid",
-                "stickers": [
-                    {
-                        "id": s.id,
-                        "face": s.face,
-                        "position": list(s.position),
-                        "color": s.color,
-                        "original_id": s.original_id
-                    } for s in self.stickers
-                ],
+                "stickers": stickers,
                 "validation": validation
             },
             "metadata": {
-                "timestamp": datetime.datetime.now().isoformat() + 'Z',
+                "timestamp": timestamp or _timestamp(),
                 "scramble": scramble_sequence,
                 "scramble_length": len(scramble_sequence.split()) if scramble_sequence else 0
             }
         }
     
     def _to_simple_format(self, scramble_sequence: Optional[str] = None) -> Dict:
-        """Export cube state in simple format (v1.0)."""
-        faces = {'U': [], 'D': [], 'F': [], 'B': [], 'L': [], 'R': []}
-        
-        for face in faces.keys():
-            face_grid = [[None for _ in range(3)] for _ in range(3)]
-            face_stickers = [s for s in self.stickers if s.face == face]
-            face_stickers.sort(key=lambda s: (s.position[0], s.position[1]))
-            
-            for sticker in face_stickers:
-                i, j = sticker.position
-                face_grid[i][j] = sticker.color
-            
-            faces[face] = face_grid
-        
+        """Export cube state in simple format (v1.0).
+
+        The face layout is positional in the colors array (U=0-8, L=9-17,
+        F=18-26, R=27-35, B=36-44, D=45-53, each in reading order), so
+        each 3x3 grid is a direct reshape of one nine-element slice.
+        """
+        face_view = self.faces
+        faces = {}
+        for face in ('U', 'D', 'F', 'B', 'L', 'R'):
+            face_grid = face_view[_FACE_ORDER.index(face)]
+            faces[face] = [[COLOR_NAMES[c] for c in row] for row in face_grid]
+
         return {
             "format_version": "1.0",
             "cube_state": {
                 "faces": faces
             },
             "metadata": {
-                "timestamp": datetime.datetime.now().isoformat() + 'Z',
+                "timestamp": _timestamp(),
                 "scramble": scramble_sequence
             }
         }
     
-    def apply_move(self, move: str) -> None:
-        """Apply a move to the cube."""
-        if move.endswith("'"):
-            base_move = move[:-1]
-            for _ in range(3):
-                self._apply_base_move(base_move)
-        elif move.endswith('2'):
-            base_move = move[:-1]
-            for _ in range(2):
-                self._apply_base_move(base_move)
-        else:
-            self._apply_base_move(move)
-    
-    def _apply_base_move(self, move: str) -> None:
-        """Apply a base move (F, R, U, B, L, D) once."""
-        if move not in self.MOVE_DEFINITIONS:
-            return
-        
-        move_def = self.MOVE_DEFINITIONS[move]
-        
-        # Rotate the face itself
-        self._rotate_face_clockwise(move_def['face'])
-        
-        # Apply adjacent piece cycles
-        self._apply_adjacent_cycles(move_def['adjacent_cycles'])
-    
-    def _rotate_face_clockwise(self, face_positions: List[int]) -> None:
-        """Rotate a face clockwise (9 positions)."""
-        if len(face_positions) != 9:
+    def apply_move(self, move: Union[str, int]) -> None:
+        """Apply a move to the cube via the precompiled permutation table.
+
+        Accepts either standard notation ("R", "U'", "F2") or an integer
+        move id (a MoveID / index into MOVE_ORDER); integer callers skip
+        the name lookup entirely. The Zobrist hash is updated
+        incrementally: only the ~20 positions the move actually changes
+        have their old keys XORed out and new keys XORed in.
+        """
+        if isinstance(move, str):
+            try:
+                move = _MOVE_NAME_TO_ID[move]
+            except KeyError:
+                raise ValueError(f"Unknown move: {move}") from None
+
+        # A move fixes 34 of the 54 positions, so instead of permuting
+        # whole arrays (two 54-element allocations per move) only the
+        # ~20 changed positions are gathered and scattered in place.
+        dst, src = _MOVE_SCATTER[move]
+        old = self.colors[dst]
+        new = self.colors[src]
+        self.colors[dst] = new
+        self.original_id[dst] = self.original_id[src]
+        self._hash ^= int(
+            np.bitwise_xor.reduce(self._ZOBRIST[dst, old])
+            ^ np.bitwise_xor.reduce(self._ZOBRIST[dst, new])
+        )
+
+    def apply_sequence(self, sequence: str) -> None:
+        """Apply a whole move sequence as one composed permutation.
+
+        The sequence is compiled into a single 54-element permutation
+        (cached across calls, so repeated algorithms such as "R U R'"
+        are composed once) and applied in one pass instead of one pass
+        per move.
+        """
+        stripped = sequence.strip()
+        if not stripped:
             return
-        
-        # Store original sticker objects
-        face_stickers = [self.stickers[pos - 1] for pos in face_positions]
-        # Clockwise rotation mapping: 0->6, 1->3, 2->0, 3->7, 4->4, 5->1, 6->8, 7->5, 8->2
-        rotation_map = [6, 3, 0, 7, 4, 1, 8, 5, 2]
-        
-        for i, new_pos in enumerate(rotation_map):
-            moved_sticker = face_stickers[new_pos]
-            self.stickers[face_positions[i] - 1] = Sticker(
-                id=face_positions[i],
-                face=moved_sticker.face,
-                position=self.stickers[face_positions[i] - 1].position,
-                color=moved_sticker.color,
-                original_id=moved_sticker.original_id
-            )
-    
-    def _apply_adjacent_cycles(self, cycles: List[List[int]]) -> None:
-        """Apply adjacent piece cycles for a move."""
-        for cycle in cycles:
-            if len(cycle) >= 4:
-                # Store sticker objects in the cycle
-                cycle_stickers = [self.stickers[pos - 1] for pos in cycle]
-                cycle_len = len(cycle)
-                
-                # For clockwise rotation, each position gets sticker from next position
-                for i, pos in enumerate(cycle):
-                    moved_sticker = cycle_stickers[(i + 1) % cycle_len]
-                    current_face = self.stickers[pos - 1].face
-                    current_position = self.stickers[pos - 1].position
-                    
-                    self.stickers[pos - 1] = Sticker(
-                        id=pos,
-                        face=current_face,
-                        position=current_position,
-                        color=moved_sticker.color,
-                        original_id=moved_sticker.original_id
-                    )
-    
-    def scramble(self, num_moves: int = 20, seed: Optional[int] = None, 
+        if not MOVE_SEQUENCE_RE.match(stripped):
+            raise ValueError(f"Invalid move sequence: '{sequence}'")
+        self._apply_permutation(_compose_sequence(tuple(stripped.split())))
+        self._recompute_hash()
+
+    def _apply_permutation(self, perm: np.ndarray) -> None:
+        """Permute the state arrays (``new[i] = old[perm[i]]``)."""
+        self.colors = self.colors[perm]
+        self.original_id = self.original_id[perm]
+
+    def scramble(self, num_moves: int = 20, seed: Optional[int] = None,
                  avoid_redundancy: bool = True, min_moves: int = 15) -> str:
-        """Generate a scrambled cube state and return the move sequence."""
-        if seed is not None:
-            random.seed(seed)
-        
+        """Generate a scrambled cube state and return the move sequence.
+
+        Move indices are drawn in bulk from a local numpy Generator
+        (seeded deterministically when ``seed`` is given). With
+        redundancy avoidance, each draw after the first selects from the
+        precomputed legal-successor table — the 15 moves not sharing the
+        previous move's face — so no draw is ever rejected and no two
+        adjacent moves share a face.
+        """
         # Ensure minimum scramble length
         actual_moves = max(num_moves, min_moves)
-        
-        moves = []
-        last_face = None
-        
-        for _ in range(actual_moves):
-            available_moves = self.MOVES.copy()
-            
-            if avoid_redundancy and last_face:
-                # Avoid consecutive moves on same face
-                available_moves = [m for m in available_moves 
-                                 if not m.startswith(last_face)]
-            
-            move = random.choice(available_moves)
-            moves.append(move)
-            self.apply_move(move)
-            last_face = move[0]
-        
-        return ' '.join(moves)
+        if actual_moves <= 0:
+            return ''
+
+        rng = np.random.default_rng(seed)
+        move_names = self.MOVES
+
+        if avoid_redundancy:
+            # One draw from all 18 moves, then one pre-sampled draw from
+            # the 15 legal successors per remaining step
+            first = int(rng.integers(0, 18))
+            raws = rng.integers(0, 15, size=actual_moves - 1)
+            chosen = [first]
+            last_face = first % 6
+            for raw in raws:
+                idx = int(_LEGAL_NEXT[last_face, raw])
+                chosen.append(idx)
+                last_face = idx % 6
+        else:
+            chosen = [int(idx) for idx in
+                      rng.integers(0, 18, size=actual_moves)]
+
+        # Apply by integer id (skipping the name lookup per move);
+        # notation strings are only rendered for the returned sequence
+        for idx in chosen:
+            self.apply_move(idx)
+
+        return ' '.join(move_names[idx] for idx in chosen)
+
+    @classmethod
+    def batch_scramble(cls, count: int, num_moves: int = 20,
+                       seed: Optional[int] = None
+                       ) -> Tuple[np.ndarray, np.ndarray]:
+        """Generate many scrambled states at once through the batch kernel.
+
+        Intended for dataset-generation workloads where per-move Python
+        dispatch dominates: move ids are sampled in bulk (same
+        legal-successor scheme as ``scramble``, vectorized across the
+        batch) and applied by the cube_model_fast kernel, which is
+        Numba-JIT-compiled when numba is installed.
+
+        Args:
+            count: Number of cubes to scramble.
+            num_moves: Scramble length per cube.
+            seed: Seed for reproducible batches.
+
+        Returns:
+            Tuple of (states, sequences): a uint8 (count, 54) array of
+            color codes and an int8 (count, num_moves) array of move ids
+            indexing ``MOVE_ORDER``.
+        """
+        # Imported lazily so plain cube usage never pays the numba
+        # import (and JIT warm-up) cost
+        from src import cube_model_fast
+
+        states = np.tile(cls._SOLVED_COLORS, (count, 1))
+        sequences = np.empty((count, max(num_moves, 0)), dtype=np.int8)
+        if num_moves <= 0:
+            return states, sequences
+
+        rng = np.random.default_rng(seed)
+        sequences[:, 0] = rng.integers(0, 18, size=count)
+        raws = rng.integers(0, 15, size=(count, num_moves - 1))
+        last_face = sequences[:, 0] % 6
+        for k in range(1, num_moves):
+            idx = _LEGAL_NEXT[last_face, raws[:, k - 1]]
+            sequences[:, k] = idx
+            last_face = idx % 6
+
+        cube_model_fast.apply_sequences(states, sequences, cls._MOVE_PERMS)
+        return states, sequences
     
+    # Bit offsets used to pack 18 3-bit color codes into one 64-bit word
+    _PACK_SHIFTS = (np.arange(18, dtype=np.uint64) * 3)
+
+    def state_key(self) -> CubeState:
+        """Pack the current sticker colors into a hashable CubeState.
+
+        Packing is vectorized: each group of 18 color codes is shifted
+        into its 3-bit lane and reduced to one 64-bit word.
+        """
+        codes = self.colors.astype(np.uint64)
+        words = [
+            int((codes[start:start + 18] << self._PACK_SHIFTS).sum())
+            for start in (0, 18, 36)
+        ]
+        return CubeState(words[0], words[1], words[2])
+
+    def pack(self) -> bytes:
+        """Pack the 54 3-bit color codes into 24 bytes.
+
+        The dense form of state_key(): same three 64-bit words, rendered
+        little-endian. Preferred key for large solver structures
+        (transposition tables, pattern databases) where the 2.25x size
+        reduction over state_bytes() matters; unpacking is never needed
+        since the 54-byte working arrays stay authoritative.
+        """
+        key = self.state_key()
+        return np.array([key.lo, key.mid, key.hi], dtype='<u8').tobytes()
+
+    def state_bytes(self) -> bytes:
+        """Return the 54 color codes as raw bytes for cheap dedup keys.
+
+        One C-level copy with no packing arithmetic; hashed at SipHash
+        speed by dict/set, making it the fastest key for scramble-dedup
+        loops. Use state_key() when the denser three-word form matters
+        (e.g. long-lived solver tables).
+        """
+        return self.colors.tobytes()
+
     def is_solved(self) -> bool:
         """Check if the cube is in solved state."""
-        for sticker in self.stickers:
-            expected_color = self.COLORS[sticker.face]
-            if sticker.color != expected_color:
-                return False
-        return True
+        return bool(np.array_equal(self.colors, self._SOLVED_COLORS))
     
+    def validate_and_serialize(self, json_path: str, format_version: str = '2.0',
+                               scramble_sequence: Optional[str] = None,
+                               pretty: bool = True
+                               ) -> Tuple[bool, List[str]]:
+        """Validate the cube state and save it to JSON in one pass.
+
+        Fuses the validation scan with serialization so the sticker list
+        is traversed once on the save hot path, instead of separately by
+        validate_state() and to_json().
+
+        Returns:
+            Tuple of (is_valid, list of error messages).
+        """
+        is_valid, errors, validation = self._validate()
+
+        if format_version in ('2.0', '2.1'):
+            buf = _dumps(self._to_hybrid_format(scramble_sequence, validation=validation,
+                                                version=format_version),
+                         pretty)
+        else:
+            buf = self._to_simple_json_bytes(scramble_sequence)
+
+        _write_bytes(json_path, buf)
+
+        return is_valid, errors
+
     def validate_state(self) -> Tuple[bool, List[str]]:
         """Validate that the cube state is legal."""
+        is_valid, errors, _ = self._validate()
+        return is_valid, errors
+
+    def _validate(self) -> Tuple[bool, List[str], Dict[str, Any]]:
+        """Run the validation scan once, returning metrics for reuse."""
         errors = []
-        
-        # Check color counts
-        color_counts = {color: 0 for color in self.COLORS.values()}
-        for sticker in self.stickers:
-            if sticker.color in color_counts:
-                color_counts[sticker.color] += 1
-            else:
-                errors.append(f"Invalid color: {sticker.color}")
-        
-        for color, count in color_counts.items():
-            if count != 9:
-                errors.append(f"Color {color} has {count} stickers, expected 9")
-        
+
+        # Histogram the color codes in one vectorized pass. Invalid color
+        # letters are rejected at load time, so codes here are always 0-5.
+        counts = np.bincount(self.colors, minlength=6)
+        for code in np.nonzero(counts != 9)[0]:
+            errors.append(
+                f"Color {COLOR_NAMES[code]} has {counts[code]} stickers, expected 9"
+            )
+
+        # Centers never move relative to each other, but which color sits
+        # on which face depends on the file's orientation convention; the
+        # orientation-independent invariant is that the six centers carry
+        # six distinct colors
+        center_colors = self.colors[list(_CENTER_INDICES)]
+        if np.unique(center_colors).size != 6:
+            letters = ''.join(COLOR_NAMES[c] for c in center_colors)
+            errors.append(
+                f"Center stickers must carry six distinct colors, got {letters}"
+            )
+
         # Basic validation - more complex parity checks would be needed for full validation
         validation_data = self._calculate_validation()
         if not validation_data['is_solvable']:
             errors.append("Cube state may violate parity constraints")
-        
-        return len(errors) == 0, errors
-    
+
+        return len(errors) == 0, errors, validation_data
+
     def _calculate_validation(self) -> Dict[str, Any]:
         """Calculate validation metrics for the cube state.
-        
+
         Note: This is a simplified validation. A complete implementation would
         require complex parity and orientation calculations based on group theory.
-        Since we generate states only through legal moves, we assume solvability.
+        Since we generate states only through legal moves, we assume solvability
+        and the metrics reduce to the shared module-level constant dict.
         """
-        # Simplified validation - assumes legal move sequences produce solvable states
-        return {
-            "parity": "even",  # Legal moves preserve even permutation parity
-            "corner_orientation_sum": 0,  # Placeholder - would need complex calculation
-            "edge_orientation_sum": 0,    # Placeholder - would need complex calculation  
-            "is_solvable": True  # Assumed for states from legal move sequences
-        }
-    
+        return _STATIC_VALIDATION
+
+
+def _build_base_permutation(move_def: Dict) -> np.ndarray:
+    """Compile a move definition into a 54-element permutation index array.
+
+    Returns ``perm`` such that after the move, the sticker at 0-based
+    position ``i`` comes from position ``perm[i]``; applying a move is
+    then a single fancy-index gather.
+    """
+    perm = np.arange(54, dtype=np.intp)
+
+    # Face rotation: position i receives the sticker from rotation_map[i]
+    # (clockwise mapping 0->6, 1->3, 2->0, 3->7, 4->4, 5->1, 6->8, 7->5, 8->2)
+    rotation_map = [6, 3, 0, 7, 4, 1, 8, 5, 2]
+    face_positions = move_def['face']
+    for i, src in enumerate(rotation_map):
+        perm[face_positions[i]] = face_positions[src]
+
+    # Adjacent cycles: each position receives the sticker from the next
+    # position in the cycle
+    for cycle in move_def['adjacent_cycles']:
+        for i, pos in enumerate(cycle):
+            perm[pos] = cycle[(i + 1) % len(cycle)]
+
+    return perm
+
+
+def _compose(first: np.ndarray, second: np.ndarray) -> np.ndarray:
+    """Compose two permutations (apply ``first``, then ``second``)."""
+    return first[second]
+
+
+def _invert(perm: np.ndarray) -> np.ndarray:
+    """Invert a permutation."""
+    return np.argsort(perm)
+
+
+@lru_cache(maxsize=16384)
+def _compose_sequence(moves: Tuple[str, ...]) -> np.ndarray:
+    """Compose a tuple of move tokens into one cached 54-element permutation."""
+    perm = Cube._MOVE_TABLE[moves[0]]
+    for move in moves[1:]:
+        perm = _compose(perm, Cube._MOVE_TABLE[move])
+    return perm
+
+
+def _build_move_table() -> Dict[str, np.ndarray]:
+    """Precompile permutation arrays for all 18 move tokens (X, X', X2).
+
+    Double and prime variants are derived from the base permutation by
+    composition and inversion, so every token applies in one gather.
+    """
+    table = {}
+    for move, move_def in Cube.MOVE_DEFINITIONS.items():
+        base = _build_base_permutation(move_def)
+        table[move] = base
+        table[f"{move}2"] = _compose(base, base)
+        table[f"{move}'"] = _invert(base)
+    return table
+
+
+# Normalize the human-readable 1-based move definitions to 0-based int8
+# index arrays, directly usable for NumPy indexing without per-access
+# `- 1` adjustments
+for _move_def in Cube.MOVE_DEFINITIONS.values():
+    _move_def['face'] = np.array(_move_def['face'], dtype=np.int8) - 1
+    _move_def['adjacent_cycles'] = [
+        np.array(_cycle, dtype=np.int8) - 1
+        for _cycle in _move_def['adjacent_cycles']
+    ]
+del _move_def
+
+Cube._MOVE_TABLE = _build_move_table()
+
+# Canonical move-id ordering (id % 6 gives the face, matching MOVES and
+# _LEGAL_NEXT) and the stacked permutation matrix consumed by the batch
+# kernel in cube_model_fast
+Cube.MOVE_ORDER = tuple(
+    [m for m in Cube.MOVE_DEFINITIONS]
+    + [f"{m}'" for m in Cube.MOVE_DEFINITIONS]
+    + [f"{m}2" for m in Cube.MOVE_DEFINITIONS]
+)
+Cube.MOVES = list(Cube.MOVE_ORDER)
+Cube._MOVE_PERMS = np.stack(
+    [Cube._MOVE_TABLE[m] for m in Cube.MOVE_ORDER]
+).astype(np.int8)
+
+# Integer move ids, derived from MOVE_ORDER so id % 6 gives the face and
+# id // 6 the variant (0 base, 1 prime, 2 double). Prime moves use a
+# _PRIME suffix since "'" is not a valid identifier character.
+MoveID = IntEnum('MoveID', {
+    name.replace("'", "_PRIME"): i for i, name in enumerate(Cube.MOVE_ORDER)
+})
+_MOVE_NAME_TO_ID = {name: i for i, name in enumerate(Cube.MOVE_ORDER)}
+
+# Compressed (dst, src) index pairs per move id, covering only the
+# positions the move actually changes; apply_move scatters these in
+# place instead of permuting the whole state, and the same dst arrays
+# drive the incremental hash update
+_MOVE_SCATTER = tuple(
+    (dst, Cube._MOVE_TABLE[m][dst])
+    for m, dst in (
+        (m, np.nonzero(Cube._MOVE_TABLE[m] != Cube._ALL_POSITIONS)[0])
+        for m in Cube.MOVE_ORDER
+    )
+)
+
+# Packed key and Zobrist hash of the solved state; lets callers test
+# solvedness or seed transposition tables with one comparison
+_solved_cube = Cube()
+Cube.SOLVED_KEY = _solved_cube.state_key()
+Cube._SOLVED_HASH = _solved_cube.zobrist_hash
+del _solved_cube
+
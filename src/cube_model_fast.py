@@ -0,0 +1,46 @@
+"""
+Optional Numba-accelerated kernels for batched cube operations.
+
+Numba is a soft dependency (like orjson in cube_model): when it is
+installed the batch kernel is JIT-compiled into a parallel, GIL-free
+loop; otherwise a pure-Python fallback with identical semantics is
+used, so callers never need to branch on its availability.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:  # pragma: no cover - exercised only without numba
+    HAS_NUMBA = False
+    prange = range
+
+
+def _apply_sequences(states: np.ndarray, moves: np.ndarray,
+                     perms: np.ndarray) -> None:
+    """Apply per-row move-id sequences to a batch of color states in place.
+
+    Args:
+        states: uint8 array of shape (batch, 54), modified in place.
+        moves: int8 array of shape (batch, num_moves) of move ids
+            (indices into ``perms``); a negative id ends a row early,
+            allowing ragged sequences via padding.
+        perms: int8 array of shape (18, 54); ``perms[m]`` is the
+            permutation for move id ``m`` (``new[i] = old[perms[m, i]]``).
+    """
+    for b in prange(states.shape[0]):
+        state = states[b]
+        for k in range(moves.shape[1]):
+            m = moves[b, k]
+            if m < 0:
+                break
+            previous = state.copy()
+            for i in range(54):
+                state[i] = previous[perms[m, i]]
+
+
+if HAS_NUMBA:
+    apply_sequences = njit(parallel=True, cache=True)(_apply_sequences)
+else:
+    apply_sequences = _apply_sequences
@@ -4,17 +4,15 @@ Cube visualization module.
 Provides functions to generate visual representations of Rubik's Cube states.
 """
 
-from typing import Optional, Tuple, Dict
-import matplotlib.pyplot as plt
-import matplotlib.patches as patches
-from PIL import Image
+from typing import Dict, Optional
+from PIL import Image, ImageDraw, ImageFont
 import numpy as np
 import os
 
 
 class CubeVisualizer:
     """Handles visualization of Rubik's Cube states."""
-    
+
     # Color mapping for visualization
     COLOR_MAP = {
         'W': '#FFFFFF',  # White
@@ -24,167 +22,308 @@ class CubeVisualizer:
         'G': '#00FF00',  # Green
         'B': '#0000FF'   # Blue
     }
-    
+
+    # Same palette as 8-bit RGB triples for the direct-draw renderer
+    COLOR_RGB = {
+        'W': (255, 255, 255),
+        'Y': (255, 255, 0),
+        'R': (255, 0, 0),
+        'O': (255, 165, 0),
+        'G': (0, 255, 0),
+        'B': (0, 0, 255)
+    }
+
     # Net layout positions for faces in the standard unfolded cube pattern
     # Layout:    U
-    #        L  F  R  B  
+    #        L  F  R  B
     #           D
     NET_LAYOUT = {
         'U': (1, 0),  # Up face - top (after y-flip: 2-0=2, so top)
         'L': (0, 1),  # Left face - middle row left
-        'F': (1, 1),  # Front face - middle row center  
+        'F': (1, 1),  # Front face - middle row center
         'R': (2, 1),  # Right face - middle row right
         'B': (3, 1),  # Back face - middle row far right
         'D': (1, 2)   # Down face - bottom (after y-flip: 2-2=0, so bottom)
     }
-    
+
+    # Face letters in sticker-index order (matches the cube's layout)
+    FACE_ORDER = ('U', 'L', 'F', 'R', 'B', 'D')
+
+    # Matplotlib base coordinates per face, derived from NET_LAYOUT once
+    # instead of recomputed for every face of every frame
+    _MPL_BASE = {
+        face: (grid_x * 3.5, (2 - grid_y) * 3.5)
+        for face, (grid_x, grid_y) in NET_LAYOUT.items()
+    }
+
+    # Default font for the direct-draw renderer, loaded once per process
+    _FONT = None
+
+    # uint8 color code -> letter LUT for face extraction, built on first use
+    _LETTER_LUT = None
+
     def __init__(self):
         """Initialize the visualizer with default settings."""
         self.fig_size = (12, 9)
         self.square_size = 1.0
         self.gap_size = 0.1
-    
-    def create_net_visualization(self, cube, output_path: str, 
-                                show_numbers: bool = True) -> None:
+        self.cell_px = 30
+        # Figure/Axes reused across mpl renders; created on first use
+        self._fig = None
+        self._ax = None
+
+    def create_net_visualization(self, cube, output_path: str,
+                                show_numbers: bool = True,
+                                engine: Optional[str] = None,
+                                dpi: int = 150) -> None:
         """
         Create a 2D net visualization of the cube.
-        
+
         Args:
             cube: The cube object to visualize
             output_path: Path to save the output image
             show_numbers: Whether to show position numbers (1-54)
+            engine: 'pil' draws directly into a pixel buffer and saves
+                in a few milliseconds; 'mpl' keeps the original
+                matplotlib rendering. None (default) selects by output
+                extension — 'pil' for raster formats Pillow can save,
+                'mpl' for anything else (notably vector formats such
+                as .svg).
+            dpi: Output resolution for the mpl engine (the pil engine
+                sizes in pixels via cell_px).
         """
         # Ensure output directory exists
         output_dir = os.path.dirname(output_path)
         if output_dir:  # Only create directory if there is one
             os.makedirs(output_dir, exist_ok=True)
-        
-        # Create figure
-        fig, ax = plt.subplots(1, 1, figsize=self.fig_size)
+
+        if engine is None:
+            engine = self._select_engine(output_path)
+
+        if engine == 'pil':
+            self._render_pil(cube, output_path, show_numbers)
+        elif engine == 'mpl':
+            self._render_mpl(cube, output_path, show_numbers, dpi)
+        else:
+            raise ValueError(f"Unknown render engine: {engine}")
+
+    @staticmethod
+    def _select_engine(output_path: str) -> str:
+        """Pick the render engine from the output file extension.
+
+        Extensions Pillow can save (png, jpg, ...) get the fast
+        direct-draw path; everything else — vector formats like .svg in
+        particular — falls back to matplotlib.
+        """
+        ext = os.path.splitext(output_path)[1].lower()
+        Image.init()
+        image_format = Image.registered_extensions().get(ext)
+        if image_format is None or image_format not in Image.SAVE:
+            return 'mpl'
+        return 'pil'
+
+    def _render_pil(self, cube, output_path: str, show_numbers: bool) -> None:
+        """Render the net by vectorized block-fill into an RGB buffer.
+
+        Each sticker is one slice assignment into a small uint8 array;
+        grid lines are 1-pixel rows/columns zeroed per face. Only the
+        position numbers and face labels go through ImageDraw.
+        """
+        cell = self.cell_px
+        face_px = cell * 3
+        # Half-cell gap between faces leaves room for the labels,
+        # mirroring the matplotlib layout's 3.5-unit stride
+        stride = face_px + cell // 2
+        pad = cell
+        width = pad * 2 + stride * 3 + face_px
+        height = pad * 2 + stride * 2 + face_px
+        arr = np.full((height, width, 3), 255, dtype=np.uint8)
+
+        face_data = self._extract_face_data(cube)
+        for face_name, (grid_x, grid_y) in self.NET_LAYOUT.items():
+            x0 = pad + grid_x * stride
+            y0 = pad + grid_y * stride
+            face_grid = face_data[face_name]
+            for i in range(3):
+                for j in range(3):
+                    arr[y0 + i * cell:y0 + (i + 1) * cell,
+                        x0 + j * cell:x0 + (j + 1) * cell] = \
+                        self.COLOR_RGB[face_grid[i][j]]
+            # Grid lines: zero out 1-pixel rows/columns over the face
+            for k in range(4):
+                arr[y0 + min(k * cell, face_px - 1), x0:x0 + face_px] = 0
+                arr[y0:y0 + face_px, x0 + min(k * cell, face_px - 1)] = 0
+
+        image = Image.fromarray(arr)
+        draw = ImageDraw.Draw(image)
+        if CubeVisualizer._FONT is None:
+            CubeVisualizer._FONT = ImageFont.load_default()
+        font = CubeVisualizer._FONT
+
+        for face_name, (grid_x, grid_y) in self.NET_LAYOUT.items():
+            x0 = pad + grid_x * stride
+            y0 = pad + grid_y * stride
+            # Face label just below the face
+            draw.text((x0 + face_px // 2, y0 + face_px + 2), face_name,
+                      fill=(0, 0, 0), font=font, anchor='ma')
+            if not show_numbers:
+                continue
+            face_idx = self.FACE_ORDER.index(face_name)
+            face_grid = face_data[face_name]
+            for i in range(3):
+                for j in range(3):
+                    # Read original_id straight from the state array —
+                    # the stickers property would materialize all 54
+                    # Sticker objects per access
+                    original_id = cube.original_id[face_idx * 9 + i * 3 + j]
+                    color = face_grid[i][j]
+                    text_color = (255, 255, 255) if color in ('R', 'B', 'G') \
+                        else (0, 0, 0)
+                    draw.text(
+                        (x0 + j * cell + cell // 2, y0 + i * cell + cell // 2),
+                        str(original_id),
+                        fill=text_color, font=font, anchor='mm'
+                    )
+
+        image.save(output_path)
+
+    def _render_mpl(self, cube, output_path: str, show_numbers: bool,
+                    dpi: int = 150) -> None:
+        """Render the net with matplotlib (legacy engine).
+
+        The Figure/Axes pair is created once and reused — when many
+        images are rendered in a loop, figure construction and backend
+        setup dominate, so each call only clears and redraws the axes.
+        """
+        # Imported here so the default PIL path never pays the
+        # matplotlib import cost; Agg avoids any GUI backend init
+        import matplotlib
+        matplotlib.use('Agg')
+        import matplotlib.pyplot as plt
+
+        if self._fig is None:
+            self._fig, self._ax = plt.subplots(1, 1, figsize=self.fig_size)
+        else:
+            self._ax.cla()
+        ax = self._ax
         ax.set_xlim(-0.5, 14.5)
         ax.set_ylim(-1.5, 11.0)  # More space for labels
         ax.set_aspect('equal')
         ax.axis('off')
-        
+
         # Extract face data from cube
         face_data = self._extract_face_data(cube)
-        
+
         # Draw each face
         for face_name, (grid_x, grid_y) in self.NET_LAYOUT.items():
-            self._draw_face(ax, face_data[face_name], face_name, 
+            self._draw_face(ax, face_data[face_name], face_name,
                           grid_x, grid_y, show_numbers, cube)
-        
+
         # Add title
         scramble_info = ""
         if hasattr(cube, '_last_scramble'):
             scramble_info = f" - {cube._last_scramble}"
-        
-        plt.title(f'Rubik\'s Cube State{scramble_info}', 
-                 fontsize=16, fontweight='bold', pad=20)
-        
-        # Save the figure
-        plt.tight_layout()
-        plt.savefig(output_path, dpi=300, bbox_inches='tight', 
-                   facecolor='white', edgecolor='none')
-        plt.close()
-    
+
+        ax.set_title(f'Rubik\'s Cube State{scramble_info}',
+                     fontsize=16, fontweight='bold', pad=20)
+
+        # Save the figure (kept alive for the next render). The net
+        # layout has fixed, known extents, so the extra render passes
+        # tight_layout and bbox_inches='tight' would spend computing
+        # them are skipped.
+        self._fig.savefig(output_path, dpi=dpi, facecolor='white')
+
     def create_numbered_visualization(self, cube, output_path: str) -> None:
         """
         Create a visualization with numbered positions (1-54) on colored squares.
-        
+
         Args:
             cube: The cube object to visualize
             output_path: Path to save the output image
         """
         self.create_net_visualization(cube, output_path, show_numbers=True)
-    
-    def _extract_face_data(self, cube) -> Dict[str, list]:
-        """Extract face color data from cube object."""
-        face_data = {}
-        
-        # Map sticker positions to faces
-        face_ranges = {
-            'U': (0, 9),
-            'L': (9, 18),
-            'F': (18, 27),
-            'R': (27, 36),
-            'B': (36, 45),
-            'D': (45, 54)
+
+    def _extract_face_data(self, cube) -> Dict[str, np.ndarray]:
+        """Extract face color data as 3x3 letter grids.
+
+        Decodes straight from the cube's (6, 3, 3) color-code view with
+        one vectorized LUT lookup per face, instead of materializing and
+        iterating 54 Sticker objects.
+        """
+        if CubeVisualizer._LETTER_LUT is None:
+            from .cube_model import COLOR_NAMES
+            CubeVisualizer._LETTER_LUT = np.array(COLOR_NAMES)
+        letters = CubeVisualizer._LETTER_LUT
+
+        face_view = cube.faces
+        return {
+            name: letters[face_view[i]]
+            for i, name in enumerate(self.FACE_ORDER)
         }
-        
-        for face_name, (start, end) in face_ranges.items():
-            face_stickers = cube.stickers[start:end]
-            # Organize into 3x3 grid
-            face_grid = []
-            for i in range(3):
-                row = []
-                for j in range(3):
-                    sticker_idx = i * 3 + j
-                    row.append(face_stickers[sticker_idx].color)
-                face_grid.append(row)
-            face_data[face_name] = face_grid
-            
-        return face_data
-    
-    def _draw_face(self, ax, face_grid, face_name: str, grid_x: int, grid_y: int, 
+
+    def _draw_face(self, ax, face_grid, face_name: str, grid_x: int, grid_y: int,
                    show_numbers: bool = False, cube=None):
         """Draw a single face of the cube."""
-        # Calculate base position for this face
-        base_x = grid_x * 3.5
-        base_y = (2 - grid_y) * 3.5  # Flip Y for correct orientation
-        
+        import matplotlib.patches as patches
+
+        # Precomputed base position for this face
+        base_x, base_y = self._MPL_BASE[face_name]
+
         # Draw each square in the 3x3 face
         for i in range(3):
             for j in range(3):
                 x = base_x + j
                 y = base_y + (2 - i)  # Flip i so that i=0 gives top row
-                
+
                 # Get color and draw colored square
                 color = face_grid[i][j]
                 color_hex = self.COLOR_MAP.get(color, '#CCCCCC')
-                
+
                 square = patches.Rectangle((x, y), 1, 1,
                                          linewidth=2, edgecolor='black',
                                          facecolor=color_hex)
                 ax.add_patch(square)
-                
+
                 if show_numbers:
-                    # Get the original_id of the sticker at this position
-                    face_order = ['U', 'L', 'F', 'R', 'B', 'D']
-                    face_idx = face_order.index(face_name)
+                    # Get the original_id of the sticker at this position,
+                    # read directly from the state array (the stickers
+                    # property materializes all 54 objects per access)
+                    face_idx = self.FACE_ORDER.index(face_name)
                     current_position_idx = face_idx * 9 + i * 3 + j  # 0-based index
-                    sticker = cube.stickers[current_position_idx]
-                    original_number = sticker.original_id
-                    
+                    original_number = cube.original_id[current_position_idx]
+
                     # Choose text color for good contrast
                     text_color = 'white' if color in ['R', 'B', 'G'] else 'black'
-                    
+
                     # Add original position number (the number that follows this sticker)
                     ax.text(x + 0.5, y + 0.5, str(original_number),
                            ha='center', va='center', fontsize=10, fontweight='bold',
                            color=text_color)
-        
+
         # Add face label - very close to the face
         label_x = base_x + 1.5
         label_y = base_y - 0.1  # Even closer to the squares
         ax.text(label_x, label_y, face_name, ha='center', va='top',
                fontsize=14, fontweight='bold')
-    
-    def visualize_from_json(self, json_path: str, output_path: str, 
-                           show_numbers: bool = True) -> None:
+
+    def visualize_from_json(self, json_path: str, output_path: str,
+                           show_numbers: bool = True,
+                           engine: Optional[str] = None) -> None:
         """
         Create visualization directly from JSON file.
-        
+
         Args:
             json_path: Path to the cube state JSON file
             output_path: Path to save the output image
             show_numbers: Whether to show position numbers
+            engine: Render engine, 'pil' or 'mpl'; None (default)
+                selects by output extension
         """
         from .cube_model import Cube
-        
+
         cube = Cube()
         cube.from_json(json_path)
-        
+
         # Try to extract scramble info from JSON metadata
         import json
         with open(json_path, 'r') as f:
@@ -192,13 +331,13 @@ class CubeVisualizer:
             scramble = data.get('metadata', {}).get('scramble', '')
             if scramble:
                 cube._last_scramble = scramble
-        
-        self.create_net_visualization(cube, output_path, show_numbers)
-    
+
+        self.create_net_visualization(cube, output_path, show_numbers, engine)
+
     def export_as_png(self, figure, output_path: str) -> None:
         """Export visualization as PNG."""
         figure.savefig(output_path, format='png', dpi=300, bbox_inches='tight')
-    
+
     def export_as_svg(self, figure, output_path: str) -> None:
         """Export visualization as SVG."""
-        figure.savefig(output_path, format='svg', bbox_inches='tight')
\ No newline at end of file
+        figure.savefig(output_path, format='svg', bbox_inches='tight')
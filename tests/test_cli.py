@@ -0,0 +1,17 @@
+"""Tests for the CLI entry point."""
+
+import os
+
+MAIN_PATH = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), '..', 'main.py')
+)
+
+
+class TestMainModule:
+    """Test suite for the main.py module source."""
+
+    def test_single_main_definition(self):
+        """main.py must define main() exactly once (no stale duplicated copies)."""
+        with open(MAIN_PATH) as f:
+            source = f.read()
+        assert source.count('def main(') == 1
@@ -10,10 +10,26 @@ from src.visualizer import CubeVisualizer
 
 class TestCubeVisualizer:
     """Test suite for CubeVisualizer class."""
-    
+
     def test_initialization(self):
         """Test visualizer initialization."""
         pass
+
+    def test_engine_selection_by_extension(self):
+        """SVG output must route to the mpl engine, raster to pil."""
+        assert CubeVisualizer._select_engine('out.png') == 'pil'
+        assert CubeVisualizer._select_engine('out.svg') == 'mpl'
+
+    def test_create_svg_visualization(self, tmp_path):
+        """An .svg output path must produce a valid SVG file."""
+        from src.cube_model import Cube
+
+        output_path = str(tmp_path / 'cube.svg')
+        CubeVisualizer().create_net_visualization(Cube.solved(), output_path)
+
+        with open(output_path, 'rb') as f:
+            header = f.read(256)
+        assert b'<svg' in header or header.startswith(b'<?xml')
     
     def test_create_net_visualization(self):
         """Test creating net visualization."""